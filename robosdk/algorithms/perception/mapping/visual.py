@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
-
 import numpy as np
 from robosdk.common.class_factory import ClassFactory
 from robosdk.common.class_factory import ClassType
@@ -38,9 +36,12 @@ class RosMapVisual(MappingBase):  # noqa
         self.curr_frame = None
 
     def initial_map(self, map_data: PgmMap):
-        map_data.map_data = np.clip(map_data.map_data, 0, 255).astype(np.uint8)
+        if map_data.map_data.dtype != np.uint8:
+            # mapping drivers already publish uint8 rgb, only convert others
+            map_data.map_data = np.clip(
+                map_data.map_data, 0, 255).astype(np.uint8)
         self.raw_map = map_data
-        self.curr_frame = deepcopy(self.raw_map.map_data)
+        self.curr_frame = self.raw_map.map_data.copy()
 
     def add_laser(self, scan: np.ndarray):
         if self.curr_frame is None:
@@ -14,9 +14,12 @@
 
 import abc
 import time
+from functools import partial
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Tuple
 
 
@@ -63,6 +66,32 @@ class BackendBase(abc.ABC):
     def subscribe(self, *args, **kwargs) -> Tuple[Any, int]:
         ...
 
+    def subscribe_many(self,
+                       items: Iterable[Tuple[str, Callable, Dict]],
+                       **kwargs) -> Dict[str, Any]:
+        """
+        Subscribe a batch of (topic, callback, parameters) items, each
+        topic is subscribed once with the parameters of its first item
+        (on top of the shared kwargs) and its messages are dispatched to
+        all the callbacks registered on it.
+        """
+        routes: Dict[str, Tuple[Dict, List[Callable]]] = {}
+        for topic, callback, parameters in items:
+            routes.setdefault(
+                topic, (parameters or {}, []))[1].append(callback)
+        subs = {}
+        for topic, (parameters, callbacks) in routes.items():
+            callback = (callbacks[0] if len(callbacks) == 1
+                        else partial(self._dispatch, tuple(callbacks)))
+            subs[topic] = self.subscribe(
+                topic, callback=callback, **dict(kwargs, **parameters))
+        return subs
+
+    @staticmethod
+    def _dispatch(callbacks: Tuple[Callable, ...], data):
+        for callback in callbacks:
+            callback(data)
+
     @abc.abstractmethod
     def unsubscribe(self, *args, **kwargs):
         ...
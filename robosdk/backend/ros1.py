@@ -46,6 +46,13 @@ class Ros1Backend(BackendBase):  # noqa
                            'uint16', 'int32', 'uint32', 'int64', 'uint64',
                            'float32', 'float64', 'string']
     ros_header_types = ['Header', 'std_msgs/Header', 'roslib/Header']
+    # socket buffer per queued message for the large message types, so
+    # a frame is not split across reads (rospy defaults to 64 KiB)
+    ros_large_msg_buff = {
+        'sensor_msgs/Image': 1 << 23,
+        'sensor_msgs/CompressedImage': 1 << 21,
+        'sensor_msgs/PointCloud2': 1 << 23,
+    }
 
     def __init__(self):
         super(Ros1Backend, self).__init__()
@@ -130,13 +137,18 @@ class Ros1Backend(BackendBase):  # noqa
                        name: str,
                        data_class: Any = None,
                        queue_size=None,
+                       buff_size=None,
                        tcp_nodelay=False):
         data_class = self.get_data_cls(
             topic=name, data_class=data_class
         )
+        if buff_size is None:
+            buff_size = max(65536, self.ros_large_msg_buff.get(
+                getattr(data_class, "_type", ""), 0) * int(queue_size or 1))
         sub = self.msg_subscriber.Subscriber(
             name, data_class=data_class,
             queue_size=queue_size,
+            buff_size=buff_size,
             tcp_nodelay=tcp_nodelay
         )
         return sub
@@ -206,16 +218,14 @@ class Ros1Backend(BackendBase):  # noqa
                 data: Any,
                 data_class: Callable,
                 queue_size: int = 1, **kwargs):
-        if not kwargs:
-            kwargs = {}
-        key_id = hash(str(kwargs))
-        key_name = (name, key_id)
-        if name not in self._pub:
-            self._pub[key_name] = self.client.Publisher(
+        key_name = (name, hash(str(kwargs)) if kwargs else 0)
+        pub = self._pub.get(key_name)
+        if pub is None:
+            pub = self._pub[key_name] = self.client.Publisher(
                 name,
                 data_class,
                 queue_size=queue_size, **kwargs)
-        self._pub[key_name].publish(data)
+        pub.publish(data)
 
     def unsubscribe(self, *topics, filter_ids: List = None):
         for topic, sub in self._sub.items():
@@ -37,6 +37,17 @@ class PgmMap(BaseModel):
     free_thresh: Decimal
     padding_map: typing.Optional[typing.List] = None
 
+    def snapshot(self) -> "PgmMap":
+        """
+        Copy the map metadata, sharing the read-only map data.
+        """
+        return self.copy(update={
+            "size": list(self.size),
+            "origin": list(self.origin),
+            "padding_map": (None if self.padding_map is None
+                            else list(self.padding_map)),
+        })
+
     def pixel2world(self,
                     x: float = 0.,
                     y: float = 0.,
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from typing import Any
 from typing import List
@@ -45,7 +46,8 @@ class Robot(RoboBase):
                  config: str = None,
                  only_sensors: List = None,
                  ignore_sensors: List = None,
-                 use_control: bool = True
+                 use_control: bool = True,
+                 preload: bool = False
                  ):
         """
         :param name: robot name
@@ -53,6 +55,8 @@ class Robot(RoboBase):
         :param only_sensors: only use sensors in this list
         :param ignore_sensors: ignore sensors in this list
         :param use_control: if use control
+        :param preload: pre-import the configured sensor modules in
+                        background threads, see `warmup`
         """
 
         super(Robot, self).__init__(name=name, config=config, kind="robots")
@@ -75,6 +79,8 @@ class Robot(RoboBase):
             self.backend = BaseConfig.BACKEND
         self._mode: RoboControlMode = RoboControlMode.Lock
         self.use_control = (use_control and "control" in self.config)
+        if preload:
+            self.warmup()
 
     @property
     def control_mode(self):
@@ -90,6 +96,29 @@ class Robot(RoboBase):
             pass
         self._mode = mode
 
+    def _skip_sensor(self, sensor: str) -> bool:
+        return bool(
+            (self.ignore_sensors and sensor in self.ignore_sensors) or
+            (self.only_sensors and sensor not in self.only_sensors)
+        )
+
+    def warmup(self, max_workers: int = 4):
+        """
+        pre-import the sensor modules declared in config in background
+        threads, so that `initial_sensors` does not pay the first import
+        cost on the `connect` path.
+        """
+        sensors = self.config.get("sensors", None) or {}
+        modules = [f"robosdk.sensors.{sensor.lower()}" for sensor in sensors
+                   if not self._skip_sensor(sensor)]
+        if not modules:
+            return
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        for module in modules:
+            # failures surface later in `add_sensor_cls`
+            pool.submit(import_module, module)
+        pool.shutdown(wait=False)
+
     def connect(self):
         """
         connect robot
@@ -119,9 +148,10 @@ class Robot(RoboBase):
 
         try:
             _ = import_module(f"robosdk.sensors.{sensor.lower()}")
-            cls = getattr(ClassType, sensor.upper())
-        except (ModuleNotFoundError, AttributeError):
+        except ModuleNotFoundError:
             cls = ClassType.GENERAL
+        else:
+            cls = getattr(ClassType, sensor.upper(), ClassType.GENERAL)
         if sensor not in self.all_sensors:
             self.all_sensors[sensor] = SensorManage()
 
@@ -141,8 +171,7 @@ class Robot(RoboBase):
         except (ModuleNotFoundError, AttributeError):
             self.logger.error(f"Non-existent sensor driver: "
                               f"`robosdk.sensors.{sensor.lower()}`")
-        if sensor not in self.all_sensors:
-            self.all_sensors[sensor] = SensorManage()
+        drivers = []
         for inx, cfg in enumerate(self.config.sensors[sensor]):
             _cfg = self._init_cfg(config=cfg['config'], kind=sensor)
             sensor_cfg = Config(_cfg)
@@ -153,26 +182,35 @@ class Robot(RoboBase):
                 driver_cls = ClassFactory.get_cls(
                     ClassType.SENSOR, sensor_cfg['driver']['name'])
                 driver = driver_cls(name=name, config=sensor_cfg)
+                driver.warmup()
                 driver.connect()
             except Exception as err:  # noqa
                 self.logger.error(
                     f"Initial sensor driver {name} failure : {err}")
             else:
-                if inx == 0:
-                    setattr(self, sensor.lower(), driver)
-                self.all_sensors[sensor].add(name=name, sensor=driver)
-        if len(self.all_sensors[sensor]) > 1:
+                drivers.append((name, driver))
+        if not drivers:
+            self.logger.error(f"No available driver for sensor {sensor}")
+            return
+        manager = self.all_sensors.get(sensor)
+        if manager is None:
+            manager = self.all_sensors[sensor] = SensorManage()
+        for name, driver in drivers:
+            manager.add(name=name, sensor=driver)
+        if self.backend:
+            manager.bulk_subscribe(self.backend)
+        setattr(self, sensor.lower(), manager[manager.default_sensor])
+        if len(manager) > 1:
             self.logger.warning(
                 f"Multiple {sensor}s defined in Robot {self.robot_name}.\n"
-                f"In this case, {self.all_sensors[sensor].default_sensor} "
+                f"In this case, {manager.default_sensor} "
                 f"is set as default. Switch the sensors excepted to use by "
                 f"calling the `switch_sensor` method.")
         self.logger.info(f"Sensor {sensor} added")
 
     async def initial_sensors(self):
         for sensor in self.config.sensors:
-            if ((self.ignore_sensors and sensor in self.ignore_sensors) or
-                    (self.only_sensors and sensor not in self.only_sensors)):
+            if self._skip_sensor(sensor):
                 self.logger.info(f"skip sensor {sensor} ...")
                 continue
             self.add_sensor_cls(sensor)
@@ -192,7 +230,7 @@ class Robot(RoboBase):
         if not self.use_control:
             return
         for ctl_dict in self.config['control']:
-            ctl = list(ctl_dict.keys())[0]
+            ctl = next(iter(ctl_dict))
             cfg = ctl_dict[ctl]
             _cfg = self._init_cfg(config=cfg['config'], kind="control")
             control = Config(_cfg)
@@ -15,14 +15,18 @@
 import abc
 import copy
 import threading
+import time
 from typing import Dict
 
 from robosdk.common.config import BaseConfig
 from robosdk.common.config import Config
 from robosdk.common.logger import logging
+from robosdk.utils.lazy_imports import LazyImport
 
 __all__ = ("SensorBase", "RosSensorBase", "SensorManage")
 
+_SENSOR_LOGGER = logging.bind(sensor=True)
+
 
 class SensorBase(metaclass=abc.ABCMeta):
     """
@@ -31,6 +35,9 @@ class SensorBase(metaclass=abc.ABCMeta):
     an environment.
     """
 
+    __slots__ = ("backend", "sensor_name", "config", "_info", "has_connect",
+                 "interaction_mode", "logger", "_get_time")
+
     def __init__(self, name: str, config: Config):
         self.backend = BaseConfig.BACKEND
         self.sensor_name = name
@@ -38,11 +45,12 @@ class SensorBase(metaclass=abc.ABCMeta):
         self._info = {}
         self.has_connect = False
         self.interaction_mode = self.config.get("driver", {}).get("type", "UK")
-        self.logger = logging.bind(instance=self.sensor_name, sensor=True)
+        self.logger = _SENSOR_LOGGER.bind(instance=self.sensor_name)
+        self._get_time = self.backend.get_time if self.backend else time.time
 
     @property
     def sys_time(self) -> float:
-        return self.backend.get_time()
+        return self._get_time()
 
     @property
     def info(self):
@@ -59,6 +67,23 @@ class SensorBase(metaclass=abc.ABCMeta):
     def info(self):
         self._info = {}
 
+    def warmup(self):
+        """
+        resolve the lazily imported dependencies of the driver, so that
+        their import cost is not paid by the first message callback.
+        """
+        for name, value in tuple(getattr(self, "__dict__", {}).items()):
+            if not isinstance(value, LazyImport):
+                continue
+            # noinspection PyBroadException
+            try:
+                # any attribute access triggers the real import
+                getattr(value, "__name__", None)
+            except Exception as err:  # noqa
+                # modules used only on some paths fail on first use instead
+                self.logger.warning(
+                    f"warm up {name} of {self.sensor_name} fail: {err}")
+
     def connect(self):
         """Connect with sensor"""
         raise NotImplementedError()
@@ -73,13 +98,17 @@ class SensorBase(metaclass=abc.ABCMeta):
 
 
 class RosSensorBase(SensorBase):  # noqa
+    __slots__ = ("data_sub", "topic_lock", "_data", "_raw")
+
     def __init__(self, name, config: Config = None):
         super(RosSensorBase, self).__init__(name=name, config=config)
         data_topic = self.config.data.target
         parameters = getattr(self.config.data, "subscribe", None) or {}
-        self.topic_lock = threading.RLock()
-        self.data_sub = self.backend.subscribe(
-            data_topic, callback=self._callback, **parameters)
+        self.topic_lock = threading.Lock()
+        self.data_sub = None
+        if not getattr(self.config.data, "bulk_subscribe", False):
+            self.data_sub = self.backend.subscribe(
+                data_topic, callback=self._callback, **parameters)
         self._data: Dict = {}
         self._raw = None
 
@@ -119,11 +148,10 @@ class RosSensorBase(SensorBase):  # noqa
         return self._data
 
     def get_data(self):
-        self.topic_lock.acquire()
-        ts = self.sys_time
-        data = copy.deepcopy(self.data)
-        self.topic_lock.release()
-        return data, ts
+        with self.topic_lock:
+            ts = self.sys_time
+            data = self.data
+        return copy.deepcopy(data), ts
 
     def _callback(self, data):
         if not self.has_connect:
@@ -136,6 +164,7 @@ class RosSensorBase(SensorBase):  # noqa
 
 
 class SensorManage:
+    __slots__ = ("default_sensor", "_all_sensors")
 
     def __init__(self):
         self.default_sensor = ""
@@ -151,8 +180,27 @@ class SensorManage:
         if name in self._all_sensors:
             del self._all_sensors[name]
         if self.default_sensor == name:
-            self.default_sensor = (list(self._all_sensors.keys())[0]
-                                   if len(self) else None)
+            self.default_sensor = next(iter(self._all_sensors), None)
+
+    def bulk_subscribe(self, backend):
+        """
+        Subscribe every managed sensor that deferred its subscription
+        (`data.bulk_subscribe`) with a single backend call.
+        """
+        pending = [sensor for sensor in self._all_sensors.values()
+                   if isinstance(sensor, RosSensorBase)
+                   and sensor.data_sub is None]
+        if not pending:
+            return
+        # keep the per-sensor subscribe parameters (data_class,
+        # queue_size, ...) that the deferred subscription skipped
+        subs = backend.subscribe_many(
+            (sensor.config.data.target, sensor._callback,  # noqa
+             getattr(sensor.config.data, "subscribe", None) or {})
+            for sensor in pending
+        )
+        for sensor in pending:
+            sensor.data_sub = subs.get(sensor.config.data.target)
 
     def clear(self):
         for sensor in self._all_sensors:
@@ -167,3 +215,56 @@ class SensorManage:
 
     def __getitem__(self, item: str) -> SensorBase:
         return self._all_sensors.get(item, None)
+
+
+def test_bulk_subscribe_kwargs():
+    from robosdk.backend.base import BackendBase
+
+    class FakeBackend(BackendBase):
+        def __init__(self):
+            super(FakeBackend, self).__init__()
+            self.calls = []
+
+        def subscribe(self, *topics, callback=None, **kwargs):
+            self.calls.append((topics, callback, kwargs))
+            return object()
+
+        connect = close = get_time = publish = get = lambda *a, **k: None
+        unsubscribe = data_transform = get_message_list = connect
+
+    parameters = {"data_class": "sensor_msgs/LaserScan",
+                  "queue_size": 5, "buff_size": 1 << 20}
+    manager = SensorManage()
+    for name in ("front", "rear"):
+        manager.add(name, RosSensorBase(name, Config({"data": {
+            "target": "/scan", "bulk_subscribe": True,
+            "subscribe": parameters}})))
+    backend = FakeBackend()
+    manager.bulk_subscribe(backend)
+    # one subscription for the shared topic, carrying the sensor kwargs
+    assert len(backend.calls) == 1
+    topics, callback, kwargs = backend.calls[0]
+    assert topics == ("/scan", ) and callable(callback)
+    assert kwargs == parameters
+    assert manager["front"].data_sub is manager["rear"].data_sub is not None
+
+
+def test_warmup_missing_module():
+    class _Sensor(SensorBase):
+        pass
+
+    import sys
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # an extension that is installed but fails to load
+        with open(f"{tmp}/robosdk_broken_ext.py", "w") as fh:
+            fh.write("raise OSError('cannot open shared object file')\n")
+        sys.path.insert(0, tmp)
+        try:
+            sensor = _Sensor("fake", Config({}))
+            sensor.missing = LazyImport("robosdk_no_such_module")
+            sensor.broken = LazyImport("robosdk_broken_ext")
+            sensor.warmup()
+        finally:
+            sys.path.remove(tmp)
@@ -20,6 +20,7 @@ from typing import Tuple
 import numpy as np
 from robosdk.common.config import Config
 from robosdk.sensors.base import SensorBase
+from robosdk.utils.queue import LatestValue
 
 
 class CameraBase(SensorBase):  # noqa
@@ -30,12 +31,21 @@ class CameraBase(SensorBase):  # noqa
 
     def __init__(self, name, config: Config = None):
         super(CameraBase, self).__init__(name=name, config=config)
-        self.camera_info_lock = threading.RLock()
-        self.camera_img_lock = threading.RLock()
+        self.camera_info_lock = threading.Lock()
+        self.camera_img_lock = threading.Lock()
         self.camera_info = None
         self.camera_P = None
         self.sensor_kind = "camera"
-        self.rgb_data = None
+        self._rgb_frames = LatestValue()
+
+    @property
+    def rgb_data(self):
+        """latest raw RGB frame received"""
+        return self._rgb_frames.get()
+
+    @rgb_data.setter
+    def rgb_data(self, value):
+        self._rgb_frames.put(value)
 
     def get_rgb(self) -> Tuple[np.array, Any]:
         """
@@ -55,8 +65,17 @@ class CameraBase(SensorBase):  # noqa
 class RGBDCameraBase(SensorBase):  # noqa
     def __init__(self, name, config: Config = None):
         super(RGBDCameraBase, self).__init__(name=name, config=config)
-        self.camera_depth_lock = threading.RLock()
-        self.dep_data = None
+        self.camera_depth_lock = threading.Lock()
+        self._dep_frames = LatestValue()
+
+    @property
+    def dep_data(self):
+        """latest raw depth frame received"""
+        return self._dep_frames.get()
+
+    @dep_data.setter
+    def dep_data(self, value):
+        self._dep_frames.put(value)
 
     def get_depth(self) -> Tuple[np.array, Any]:
         """
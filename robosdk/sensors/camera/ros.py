@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
+import sys
+import threading
+from functools import partial
+from typing import Callable
 
 import numpy as np
 from robosdk.common.class_factory import ClassFactory
@@ -25,6 +28,48 @@ from .base import RGBDCameraBase
 
 __all__ = ("RosCameraDriver", "RosRGBDCameraDriver")
 
+# sensor_msgs/Image encodings that map directly onto a numpy buffer
+_IMG_ENCODINGS = {
+    "bgr8": (np.uint8, 3),
+    "rgb8": (np.uint8, 3),
+    "bgra8": (np.uint8, 4),
+    "rgba8": (np.uint8, 4),
+    "mono8": (np.uint8, 1),
+    "mono16": (np.uint16, 1),
+    "8UC1": (np.uint8, 1),
+    "8UC3": (np.uint8, 3),
+    "16UC1": (np.uint16, 1),
+    "32FC1": (np.float32, 1),
+}
+
+
+def _stamp_sec(msg) -> float:
+    """header stamp of a ROS1/ROS2 message in seconds"""
+    stamp = msg.header.stamp
+    if hasattr(stamp, "to_sec"):
+        return stamp.to_sec()
+    return stamp.sec + stamp.nanosec * 1e-9
+
+
+def _frame_layout(msg) -> tuple:
+    """the fields a specialised decoder depends on, compressed messages
+    only carry a `format`"""
+    return (getattr(msg, "encoding", None) or getattr(msg, "format", None),
+            getattr(msg, "height", 0), getattr(msg, "width", 0),
+            getattr(msg, "step", 0), getattr(msg, "is_bigendian", 0))
+
+
+def _decode_raw(msg, dtype: np.dtype, height: int, width: int,
+                channels: int, row_items: int, swap: bool) -> np.ndarray:
+    """view a raw image message of known layout as a ndarray"""
+    img = np.frombuffer(msg.data, dtype=dtype).reshape(
+        height, row_items)[:, :width * channels]
+    if channels > 1:
+        img = img.reshape(height, width, channels)
+    if swap:
+        img = img.astype(dtype.newbyteorder("="))
+    return img
+
 
 @ClassFactory.register(ClassType.SENSOR, alias="ros_camera_driver")
 class RosCameraDriver(CameraBase):  # noqa
@@ -32,19 +77,24 @@ class RosCameraDriver(CameraBase):  # noqa
     def __init__(self, name, config: Config = None):
         bridge = LazyImport("cv_bridge")
         super(RosCameraDriver, self).__init__(name=name, config=config)
+        self.cv2 = LazyImport("cv2")
         rgb_topic = self.config.rgb.target
         rgb_s_p = getattr(self.config.rgb, "subscribe", None) or {}
         info_s_p = getattr(self.config.info, "subscribe", None) or {}
         self.cv_bridge = bridge.CvBridge()
 
-        if self.config.rgb.get("is_compressed", False):
-            self._bridge = self.cv_bridge.compressed_imgmsg_to_cv2
+        self._compressed = bool(self.config.rgb.get("is_compressed", False))
+        if self._compressed:
             data_class = self.backend.msg_sensor_generator.CompressedImage
         else:
-            self._bridge = self.cv_bridge.imgmsg_to_cv2
             data_class = self.backend.msg_sensor_generator.Image
         if "data_class" not in rgb_s_p:
             rgb_s_p["data_class"] = data_class
+        # stream -> decoder specialised on the stream's frame layout
+        self._decoders = {}
+        # decoded frame cache, refreshed only when a new message arrives
+        self._rgb_data = None
+        self._rgb_dirty = False
         self.rgb_sub = self.backend.subscribe(
             rgb_topic,
             callback=self._rgb_callback,
@@ -54,33 +104,88 @@ class RosCameraDriver(CameraBase):  # noqa
             self.config.info.target,
             callback=self._camera_info_callback, **info_s_p
         )
-        self._rgb_data = None
 
     @property
     def rgb(self):
-        if self.rgb_data is not None:
-            try:
-                self._rgb_data = self._bridge(
-                    self.rgb_data, self.config.rgb.encoding)
-                # if (self.config.rgb.encoding == "bgr8" and
-                #         BaseConfig.MAC_TYPE.startswith("aarch")):
-                #     self._rgb_data = self._rgb_data[:, :, ::-1]
-            except Exception as e:  # noqa
-                self.logger.error(f"get rgb data from camera "
-                                  f"[{self.sensor_name}] fail: {str(e)}")
-        else:
+        if not self._rgb_dirty:
+            return self._rgb_data
+        with self.camera_img_lock:
+            # clear before reading so a frame arriving meanwhile
+            # marks the cache dirty again
+            self._rgb_dirty = False
+            rgb_data = self.rgb_data
+        if rgb_data is None:
             self._rgb_data = None
+            return None
+        try:
+            self._rgb_data = self._decode(
+                "rgb", rgb_data, compressed=self._compressed)
+            # if (self.config.rgb.encoding == "bgr8" and
+            #         BaseConfig.MAC_TYPE.startswith("aarch")):
+            #     self._rgb_data = self._rgb_data[:, :, ::-1]
+        except Exception as e:  # noqa
+            self.logger.error(f"get rgb data from camera "
+                              f"[{self.sensor_name}] fail: {str(e)}")
         return self._rgb_data
 
+    def _image_decoder(self, msg, encoding: str,
+                       compressed: bool = False) -> Callable:
+        """
+        Specialise a decoder for the layout of `msg`, viewing the message
+        buffer directly for the common encodings and falling back to
+        cv_bridge for the others.
+        """
+        if compressed:
+            if encoding != "bgr8":
+                return partial(self.cv_bridge.compressed_imgmsg_to_cv2,
+                               desired_encoding=encoding)
+            return self._decode_compressed
+        fmt = _IMG_ENCODINGS.get(msg.encoding)
+        if fmt is None or encoding not in (msg.encoding, "passthrough"):
+            return partial(self.cv_bridge.imgmsg_to_cv2,
+                           desired_encoding=encoding)
+        dtype, channels = fmt
+        dtype = np.dtype(dtype).newbyteorder(">" if msg.is_bigendian else "<")
+        return partial(
+            _decode_raw, dtype=dtype,
+            height=msg.height, width=msg.width, channels=channels,
+            # rows may be padded, `step` is the row length in bytes
+            row_items=msg.step // dtype.itemsize,
+            swap=bool(msg.is_bigendian) != (sys.byteorder == "big")
+        )
+
+    def _decode_compressed(self, msg):
+        return self.cv2.imdecode(
+            np.frombuffer(msg.data, dtype=np.uint8), self.cv2.IMREAD_COLOR)
+
+    def _fast_imgmsg_to_cv2(self, msg, encoding: str,
+                            compressed: bool = False):
+        """Decode an image message into a ndarray"""
+        return self._image_decoder(msg, encoding, compressed)(msg)
+
+    def _decode(self, stream: str, msg, compressed: bool = False):
+        """
+        Decode a frame of `stream` with the decoder specialised on its
+        layout, the decoder is rebuilt when the layout of a frame
+        (encoding, size, step, byte order) differs from the cached one.
+        """
+        layout = _frame_layout(msg)
+        cached = self._decoders.get(stream)
+        if cached is not None and cached[0] == layout:
+            return cached[1](msg)
+        decoder = self._image_decoder(
+            msg, self.config[stream].encoding, compressed=compressed)
+        self._decoders[stream] = (layout, decoder)
+        return decoder(msg)
+
     def get_rgb(self):
         """
         This function returns the RGB image perceived by the camera.
         """
-        self.camera_img_lock.acquire()
         ts = self.sys_time
-        rgb = copy.deepcopy(self.rgb)
-        self.camera_img_lock.release()
-        return rgb, ts
+        # the decoded frame is replaced, never written, on new messages
+        rgb = self.rgb
+        return (None if rgb is None else rgb.copy()), ts
 
     def _rgb_callback(self, rgb):
         if not self.has_connect:
@@ -88,16 +193,17 @@ class RosCameraDriver(CameraBase):  # noqa
         self._info["rgb"]["count"] += 1
         if rgb is not None:
             self.rgb_data = rgb
+            self._rgb_dirty = True
         else:
             self._info["rgb"]["error"] += 1
 
     def _camera_info_callback(self, msg):
         if self.has_connect:  # only change on start
             return
-        self.camera_info_lock.acquire()
-        self.camera_info = msg
-        self.camera_P = np.array(msg.P).reshape((3, 4))
-        self.camera_info_lock.release()
+        camera_p = np.array(msg.P).reshape((3, 4))
+        with self.camera_info_lock:
+            self.camera_info = msg
+            self.camera_P = camera_p
 
     def connect(self):
         if self.has_connect:
@@ -108,6 +214,7 @@ class RosCameraDriver(CameraBase):  # noqa
         self.reset()
 
     def reset(self):
+        self._decoders.clear()
         self._info["rgb"] = {
             "count": 0, "error": 0, "target": self.config.rgb.target,
             "connect": self.sys_time, "close": 0
@@ -126,22 +233,27 @@ class RosRGBDCameraDriver(RGBDCameraBase, RosCameraDriver):  # noqa
 
     def __init__(self, name, config: Config = None):
         super(RosRGBDCameraDriver, self).__init__(name=name, config=config)
-        self.cv2 = LazyImport("cv2")
-        self.sync = self.backend.msg_subscriber
         self.rgb_depth = [None, None]
+        # latest unpaired frame of each stream, a pair is emitted as soon
+        # as both stamps are within `sync_slop` seconds
+        self._sync_lock = threading.Lock()
+        self._rgb_latest = None
+        self._dep_latest = None
+        self._sync_slop = float(self.config.get("sync_slop", None) or 0.05)
         depth_topic = self.config.depth.target
         dep_s_p = getattr(self.config.depth, "subscribe", None) or {}
         if "data_class" not in dep_s_p:
             dep_s_p["data_class"] = self.backend.msg_sensor_generator.Image
 
+        self._dep_data = None
+        self._dep_dirty = False
+        self._depth_scale = self._get_depth_scale()
         self.depth_sub = self.backend.subscribe(
             depth_topic, callback=self._dep_callback, **dep_s_p)
-        self._dep_data = None
-        self.sync_sub = self.backend.subscribe(
-            self.config.rgb.target,
-            depth_topic,
-            callback=self._rgbd_callback
-        )
+
+    def _rgb_callback(self, rgb):
+        super(RosRGBDCameraDriver, self)._rgb_callback(rgb)
+        self._sync(rgb=rgb)
 
     def _dep_callback(self, depth):
         if not self.has_connect:
@@ -149,30 +261,61 @@ class RosRGBDCameraDriver(RGBDCameraBase, RosCameraDriver):  # noqa
         self._info["depth"]["count"] += 1
         if depth is not None:
             self.dep_data = depth
+            self._dep_dirty = True
+            self._sync(depth=depth)
         else:
             self._info["depth"]["error"] += 1
 
+    def _sync(self, rgb=None, depth=None):
+        """pair the most recent rgb and depth frames, dropping stale ones"""
+        if not self.has_connect:
+            return
+        with self._sync_lock:
+            if rgb is not None:
+                self._rgb_latest = rgb
+            if depth is not None:
+                self._dep_latest = depth
+            rgb, depth = self._rgb_latest, self._dep_latest
+            if rgb is None or depth is None:
+                return
+            if abs(_stamp_sec(rgb) - _stamp_sec(depth)) > self._sync_slop:
+                return
+            self._rgb_latest = self._dep_latest = None
+        self._rgbd_callback(rgb, depth)
+
     def _rgbd_callback(self, rgb, depth):
         if not self.has_connect:
             return
-        self._rgb_callback(rgb)
-        self._dep_callback(depth)
-        rgb, _ = self.get_rgb()
-        depth, _ = self.get_depth()
+        # decode the paired messages directly rather than round-tripping
+        # through the locked, copying getters
+        try:
+            rgb = self._decode("rgb", rgb, compressed=self._compressed)
+            if not rgb.flags.writeable:
+                rgb = rgb.copy()
+            depth = self._decode("depth", depth)
+            depth = self._scale_depth(self._clean_depth(depth, copy=True))
+        except Exception as e:  # noqa
+            self.logger.error(f"get rgbd data from camera "
+                              f"[{self.sensor_name}] fail: {str(e)}")
+            return
         self.rgb_depth = [rgb, depth]
 
     @property
     def dep(self):
-        if self.dep_data is not None:
-            try:
-                self._dep_data = self._bridge(
-                    self.dep_data, self.config.depth.encoding)
-                self._dep_data = np.nan_to_num(self._dep_data)
-            except Exception as e:  # noqa
-                self.logger.error(f"get depth data from camera "
-                                  f"[{self.sensor_name}] fail: {str(e)}")
-        else:
+        if not self._dep_dirty:
+            return self._dep_data
+        with self.camera_depth_lock:
+            self._dep_dirty = False
+            dep_data = self.dep_data
+        if dep_data is None:
             self._dep_data = None
+            return None
+        try:
+            self._dep_data = self._clean_depth(
+                self._decode("depth", dep_data))
+        except Exception as e:  # noqa
+            self.logger.error(f"get depth data from camera "
+                              f"[{self.sensor_name}] fail: {str(e)}")
         return self._dep_data
 
     def connect(self):
@@ -183,7 +326,13 @@ class RosRGBDCameraDriver(RGBDCameraBase, RosCameraDriver):  # noqa
         self.has_connect = True
         self.reset()
 
+    def _get_depth_scale(self) -> float:
+        map_factor = self.config.depth.get("map_factor", None)
+        return 1.0 / map_factor if map_factor else 0.0
+
     def reset(self):
+        self._decoders.clear()
+        self._depth_scale = self._get_depth_scale()
         now = self.sys_time
         self._info["rgb"] = {
             "count": 0, "error": 0, "target": self.config.rgb.target,
@@ -213,16 +362,48 @@ class RosRGBDCameraDriver(RGBDCameraBase, RosCameraDriver):  # noqa
 
         :rtype: np.ndarray or None
         """
-        self.camera_depth_lock.acquire()
         ts = self.sys_time
-        depth = copy.deepcopy(self.dep)
-        self.camera_depth_lock.release()
-        if self.config.depth.map_factor:
-            depth = depth / self.config.depth.map_factor
+        depth = self.dep
+        if depth is None:
+            return depth, ts
+        return self._scale_depth(depth.copy()), ts
+
+    @staticmethod
+    def _clean_depth(depth: np.ndarray, copy: bool = False) -> np.ndarray:
+        """replace NaN of float frames in place, copying read-only views"""
+        if depth.dtype.kind != "f":
+            return depth.copy() if copy else depth
+        if copy or not depth.flags.writeable:
+            depth = depth.copy()
+        np.nan_to_num(depth, copy=False)
+        return depth
+
+    def _scale_depth(self, depth: np.ndarray) -> np.ndarray:
+        """map a privately owned depth frame to meters, in place if float"""
+        if self._depth_scale:
+            if depth.dtype.kind == "f":
+                np.multiply(depth, self._depth_scale, out=depth)
+            else:
+                depth = depth * self._depth_scale
+        elif depth.dtype.kind == "f":
+            self._normalize(depth)
         else:
             depth = self.cv2.normalize(depth, depth, 0, 255,
                                        self.cv2.NORM_MINMAX)
-        return depth, ts
+        return depth
+
+    @staticmethod
+    def _normalize(depth: np.ndarray, upper: float = 255.):
+        """in-place min-max scaling of a float frame into [0, upper]"""
+        if not depth.size:
+            return depth
+        mn, mx = depth.min(), depth.max()
+        if mx > mn:
+            np.subtract(depth, mn, out=depth)
+            np.multiply(depth, upper / (mx - mn), out=depth)
+        else:
+            depth.fill(0)
+        return depth
 
     def get_rgb_depth(self):
         return self.rgb_depth
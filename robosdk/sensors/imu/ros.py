@@ -32,48 +32,40 @@ class RosIMUDriver(RosSensorBase, IMUBase):  # noqa
     def __init__(self, name, config: Config = None):
         super(RosIMUDriver, self).__init__(name=name, config=config)
         self.frame_id = getattr(self.config.data, "frame_id", "") or "base_link"
+        self._imu_msg = None
+
+    def _get_vector(self, field: str, with_w: bool = False) -> BasePose:
+        # message fields are already floats, `construct` skips pydantic
+        # validation and the per-attribute __setattr__ dispatch
+        data = None if self._raw is None else getattr(self._raw, field, None)
+        if data is None:
+            return BasePose()
+        if with_w:
+            return BasePose.construct(x=data.x, y=data.y, z=data.z, w=data.w)
+        return BasePose.construct(x=data.x, y=data.y, z=data.z, w=0.0)
 
     def get_orientation(self) -> Tuple[BasePose, Any]:
-        orientation = BasePose()
         ts = self.sys_time
-        if self._raw is not None:
-            data = getattr(self._raw, "orientation", None)
-            if data is not None:
-                orientation.x = data.x
-                orientation.y = data.y
-                orientation.z = data.z
-                orientation.w = data.w
-        return orientation, ts
+        return self._get_vector("orientation", with_w=True), ts
 
     def get_angular_velocity(self) -> Tuple[BasePose, Any]:
-        angel = BasePose()
         ts = self.sys_time
-        if self._raw is not None:
-            data = getattr(self._raw, "angular_velocity", None)
-            if data is not None:
-                angel.x = data.x
-                angel.y = data.y
-                angel.z = data.z
-        return angel, ts
+        return self._get_vector("angular_velocity"), ts
 
     def get_linear_acceleration(self) -> Tuple[BasePose, Any]:
-        linear = BasePose()
         ts = self.sys_time
-        if self._raw is not None:
-            data = getattr(self._raw, "linear_acceleration", None)
-            if data is not None:
-                linear.x = data.x
-                linear.y = data.y
-                linear.z = data.z
-        return linear, ts
+        return self._get_vector("linear_acceleration"), ts
 
     def update(self,
                orientation: BasePose = None,
                linear_acceleration: BasePose = None,
                angular_velocity: BasePose = None,
                ):
-        imu = self.backend.msg_sensor_generator.Imu()
-        imu.header.frame_id = self.frame_id
+        imu = self._imu_msg
+        if imu is None:
+            # publish is serialized synchronously, so one message is reused
+            imu = self._imu_msg = self.backend.msg_sensor_generator.Imu()
+            imu.header.frame_id = self.frame_id
         imu.header.stamp = self.backend.now
         if orientation is None:
             orientation = BasePose()
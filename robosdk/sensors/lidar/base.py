@@ -30,7 +30,7 @@ class LidarBase(SensorBase):  # noqa
         self.sensor_kind = "lidar"
         self.points = None
         self.intensity = None
-        self.data_lock = threading.RLock()
+        self.data_lock = threading.Lock()
 
     def get_points(self) -> Tuple[np.ndarray, Any]:
         raise NotImplementedError
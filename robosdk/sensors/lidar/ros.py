@@ -12,9 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
 from typing import Any
-from typing import List
 from typing import Tuple
 
 import numpy as np
@@ -33,6 +31,8 @@ class RosLaserDriver(LidarBase):  # noqa
 
     def __init__(self, name, config: Config = None):
         super(RosLaserDriver, self).__init__(name=name, config=config)
+        # (angle_min, angle_increment, n) -> (cos, sin) of the beam angles
+        self._trig_cache = {}
         parameters = getattr(self.config.data, "subscribe", None) or {}
         self.lidar_sub = self.backend.subscribe(
             self.config.data.target,
@@ -42,52 +42,91 @@ class RosLaserDriver(LidarBase):  # noqa
         self._tf = LazyImport("tf")
         self._base_link = getattr(self.config.data, "base_link", "laser")
         self._map_frame = getattr(self.config.data, "map_frame", "map")
+        self._tf_listener = None
+        # last seen (translation, quaternion, float32 transposed rotation)
+        self._tf_cache = None
+        # reusable homogeneous (N, 4) buffer for the point transform
+        self._pad = None
+
+    def _lookup_transform(self):
+        if self._tf_listener is None:
+            # the listener buffers transforms for the driver's lifetime,
+            # so the warm-up wait is only paid once
+            self._tf_listener = self._tf.TransformListener()
+            self._tf_listener.waitForTransform(
+                self._base_link, self._map_frame,
+                self.backend.client.Time(0),
+                timeout=self.backend.client.Duration(10.)
+            )
+        try:
+            trans, quat = self._tf_listener.lookupTransform(
+                self._map_frame, self._base_link,
+                self.backend.client.Time(0),
+            )
+        except self._tf.LookupException:
+            if self._tf_cache is None:
+                raise
+            trans, quat = self._tf_cache[:2]
+        if self._tf_cache is None or self._tf_cache[:2] != (trans, quat):
+            rotation = self._tf.transformations.quaternion_matrix(quat)
+            self._tf_cache = (
+                trans, quat,
+                np.ascontiguousarray(rotation.T, dtype=np.float32)
+            )
+        return trans, self._tf_cache[2]
 
     def quat2mat(self, data: np.ndarray):
-
-        listener = self._tf.TransformListener()
-        listener.waitForTransform(
-            self._base_link, self._map_frame,
-            self.backend.client.Time(0),
-            timeout=self.backend.client.Duration(10.)
-        )
-
-        trans, rotation = listener.lookupTransform(
-            self._map_frame, self._base_link,
-            self.backend.client.Time(0),
-        )
-        rotation = self._tf.transformations.quaternion_matrix(rotation)
-        shape = data.shape
-        s = 4 - shape[1]
-        if s > 0:
-            data = np.hstack((data, np.zeros((shape[0], s))))
-        elif s < 0:
-            data = data[..., : 4]
-        points = rotation.dot(data.T).T
-        points[..., 0] += trans[0]
-        points[..., 1] += trans[1]
-        points[..., 2] += trans[2]
+        trans, rotation_t = self._lookup_transform()
+        num, dim = data.shape[0], min(data.shape[1], 4)
+        if self._pad is None or len(self._pad) < num:
+            self._pad = np.empty((num, 4), dtype=np.float32)
+        pad = self._pad[:num]
+        pad[:, :dim] = data[:, :dim]
+        pad[:, dim:] = 0
+        points = pad @ rotation_t
+        points[:, :3] += np.asarray(trans[:3], dtype=np.float32)
 
         return points
 
+    def _beam_trig(self, theta_left: float, theta_step: float, num: int):
+        """cos/sin of the beam angles, fixed for a given lidar"""
+        key = (theta_left, theta_step, num)
+        trig = self._trig_cache.get(key)
+        if trig is None:
+            # generate the range of angles
+            thetas = theta_left + theta_step * np.arange(num)
+            trig = (np.cos(thetas).astype(np.float32),
+                    np.sin(thetas).astype(np.float32))
+            self._trig_cache[key] = trig
+        return trig
+
     def _callback(self, laser_scan):
-        self._raw = deepcopy(laser_scan)
+        # callbacks receive a fresh message, keep a reference not a copy
+        self._raw = laser_scan
         theta_left, theta_step, dist_min, dist_max, distances = (
             laser_scan.angle_min, laser_scan.angle_increment,
             laser_scan.range_min, laser_scan.range_max,
-            np.array(laser_scan.ranges)
+            np.asarray(laser_scan.ranges, dtype=np.float32)
         )
-        # generate the range of angles
-        thetas = theta_left + theta_step * np.arange(len(distances))
+        cos_t, sin_t = self._beam_trig(theta_left, theta_step, distances.size)
 
-        # filter out the angles with inappropriate distances
+        # filter out the angles with inappropriate distances, NaN ranges
+        # fail both comparisons so a single mask also drops them
         valid = (distances >= dist_min) & (distances <= dist_max)
-        xs: List[float] = distances[valid] * np.cos(thetas[valid])
-        ys: List[float] = distances[valid] * np.sin(thetas[valid])
-        self.points = np.array(list(zip(xs, ys))).astype(np.float32)
+        if valid.all():
+            # common case, skip the boolean gathers entirely
+            d = distances
+        else:
+            d = distances[valid]
+            cos_t, sin_t = cos_t[valid], sin_t[valid]
+        points = np.empty((d.size, 2), dtype=np.float32)
+        np.multiply(cos_t, d, out=points[:, 0])
+        np.multiply(sin_t, d, out=points[:, 1])
+        self.points = points
 
         if hasattr(laser_scan, "intensities"):
-            self.intensity = np.asarray(self._raw.intensities)
+            self.intensity = np.asarray(
+                laser_scan.intensities, dtype=np.float32)
 
     def connect(self):
         if self.has_connect:
@@ -101,8 +140,7 @@ class RosLaserDriver(LidarBase):  # noqa
         return self.points
 
     def get_points(self) -> Tuple[np.ndarray, Any]:
-        self.data_lock.acquire()
-        ts = self.sys_time
-        data = deepcopy(self.data)
-        self.data_lock.release()
-        return data, ts
+        with self.data_lock:
+            ts = self.sys_time
+            data = self.data
+        return (None if data is None else data.copy()), ts
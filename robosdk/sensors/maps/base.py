@@ -32,9 +32,10 @@ class MapBase(SensorBase):  # noqa
         super(MapBase, self).__init__(name=name, config=config)
         self.obstacles = []
         self.map_data = None
+        self.grid_data = None
         self.map_info = None
         self.sensor_kind = "map"
-        self.data_lock = threading.RLock()
+        self.data_lock = threading.Lock()
 
     def get_data(self) -> Tuple[PgmMap, Any]:
         """
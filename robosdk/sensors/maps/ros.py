@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import os
 import tempfile
 from typing import Any
@@ -32,6 +31,14 @@ from robosdk.utils.lazy_imports import LazyImport
 
 from .base import MapBase
 
+try:
+    # libyaml bindings, map files never need python object tags
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
 __all__ = ("RosMappingDriver",)
 
 
@@ -42,17 +49,22 @@ class RosMappingDriver(MapBase):  # noqa
         super(RosMappingDriver, self).__init__(name=name, config=config)
         self._cv2 = LazyImport("cv2")
         self._raw_map = None
+        self._unknown_mask = None
+        # occupancy value (as an unsigned byte) -> rgb, other values are black
+        self._palette = np.zeros((256, 3), dtype=np.uint8)
+        for item in (PgmItem.FREE, PgmItem.OBSTACLE, PgmItem.UNKNOWN):
+            self._palette[item.value & 0xFF] = PgmColor[item.name].value
         if self.config.data.kind == "topic":
             self.get_map_from_topic()
         else:
             self.get_map_from_mapfile()
 
     def get_data(self) -> Tuple[PgmMap, Any]:
-        self.data_lock.acquire()
+        # map_info is only ever replaced as a whole and its map_data is
+        # read-only, so a snapshot can share the array with the driver
         ts = self.sys_time
-        data = copy.deepcopy(self.map_info)
-        self.data_lock.release()
-        return data, ts
+        map_info = self.map_info
+        return (None if map_info is None else map_info.snapshot()), ts
 
     def connect(self):
         self.has_connect = True
@@ -80,15 +92,19 @@ class RosMappingDriver(MapBase):  # noqa
 
         height, width = int(info.height), int(info.width)
         _data = np.flipud(
-            np.reshape(np.array(msg.data), (height, width))
+            np.reshape(self._grid_array(msg.data), (height, width))
         )
-        self.map_data = np.zeros([height, width, 3])
-        self.map_data[_data == PgmItem.FREE.value] = PgmColor.FREE.value
-        self.map_data[_data == PgmItem.OBSTACLE.value] = PgmColor.OBSTACLE.value
-        self.map_data[_data == PgmItem.UNKNOWN.value] = PgmColor.UNKNOWN.value
-        obstacles = list(zip(*np.where(_data != PgmItem.UNKNOWN.value)))
-
-        self.map_info = PgmMap(
+        # reinterpret in place rather than masking into a new int array
+        cells = _data.view(np.uint8)
+        self.grid_data = _data
+        self._unknown_mask = None
+        self.map_data = self._palette[cells]
+        # published snapshots (and the views cropped from them) share
+        # this buffer, so freeze the base array itself
+        self.map_data.setflags(write=False)
+        obstacles = np.argwhere(cells != (PgmItem.UNKNOWN.value & 0xFF))
+
+        map_info = PgmMap(
             map_data=self.map_data,
             size=[height, width],
             resolution=round(float(info.resolution), 4),
@@ -102,11 +118,30 @@ class RosMappingDriver(MapBase):  # noqa
             free_thresh=.2,
 
         )
-        self.obstacles = self.map_info.calc_obstacle_map(obstacles)
+        obstacles = map_info.calc_obstacle_map(obstacles)
+        with self.data_lock:
+            self.map_info, self.obstacles = map_info, obstacles
+
+    @property
+    def unknown_mask(self):
+        """unknown cells of the current grid, computed once per map"""
+        if self._unknown_mask is None and self.grid_data is not None:
+            self._unknown_mask = self.grid_data < 0
+        return self._unknown_mask
+
+    @staticmethod
+    def _grid_array(data) -> np.ndarray:
+        """view occupancy data as int8 without a python level copy"""
+        try:
+            # ros2 array('b') and raw buffers expose the buffer protocol
+            return np.frombuffer(data, dtype=np.int8)
+        except TypeError:
+            # rospy deserializes int8[] into a tuple of ints
+            return np.asarray(data, dtype=np.int8)
 
     def get_map_from_mapfile(self):
         with open(self.config.data.config) as f:
-            data = yaml.load(f, Loader=yaml.FullLoader)
+            data = yaml.load(f, Loader=_Loader)
         self._raw_map = data
         image = self.config.data.map or data['image']
         if not os.path.isfile(image):
@@ -128,50 +163,67 @@ class RosMappingDriver(MapBase):  # noqa
         self.map_info = _info = map_path
         if map_path.image:
             fh = Image.open(map_path.image)
-            height, width = fh.size
-            data = np.array(fh)  # noqa
-            occ = data / 255. if _info.reverse else (255. - data) / 255.
-            self.map_data = (np.zeros([height, width, 3]) +
-                             PgmColor.UNKNOWN.value)
-            self.map_data[occ > _info.occupied_thresh] = PgmColor.OBSTACLE.value
-            self.map_data[occ < _info.free_thresh] = PgmColor.FREE.value
+            data = np.asarray(fh)  # noqa
+            height, width = data.shape[:2]
+            if data.dtype == np.uint8:
+                # classify the 256 possible grey levels once, then gather
+                lut = self._pgm_palette(np.arange(256), _info)
+                self.map_data = lut[data]
+            else:
+                self.map_data = self._pgm_palette(data, _info)
             map_path.size = [height, width]
 
+    @staticmethod
+    def _pgm_palette(data: np.ndarray, info: PgmMap) -> np.ndarray:
+        """colour grey levels by the occupancy thresholds of the map"""
+        occ = data / 255. if info.reverse else (255. - data) / 255.
+        colour = np.empty(occ.shape + (3,), dtype=np.uint8)
+        colour[...] = PgmColor.UNKNOWN.value
+        colour[occ > float(info.occupied_thresh)] = PgmColor.OBSTACLE.value
+        colour[occ < float(info.free_thresh)] = PgmColor.FREE.value
+        return colour
+
     def save(self, file_out, tar: bool = True):
         zip_write = LazyImport("zipfile")
         map_file_config = {
-            "resolution": self.info.resolution,
-            "origin": self.info.origin,
-            "occupied_thresh": self.info.occupied_thresh,
-            "free_thresh": self.info.free_thresh,
+            "resolution": float(self.info.resolution),
+            "origin": [float(v) for v in self.info.origin],
+            "occupied_thresh": float(self.info.occupied_thresh),
+            "free_thresh": float(self.info.free_thresh),
             "negate": int(self.info.reverse)
         }
 
-        dst = tempfile.mkdtemp()
-        image_path = os.path.join(dst, "map.pgm")
-        yml_path = os.path.join(dst, "map.yml")
-
-        map_file_config["image"] = os.path.basename(image_path)
-
-        with open(yml_path, 'w') as file:
-            yaml.dump(map_file_config, file)
+        map_file_config["image"] = "map.pgm"
 
         max_value = np.iinfo(np.uint8).max
         unknown_value = int(max_value * (self.info.occupied_thresh +
                                          self.info.free_thresh) / 2.)
-        image = self.map_data.astype(np.float32)
-        image = image / 100.0 * max_value
-        image = image.astype(np.uint8)
-        image = self._cv2.bitwise_not(image)
-        image[np.where(self.grid_data < 0)] = unknown_value
-        image = np.flipud(image)
-        self._cv2.imwrite(image_path, image)
+        # scale, saturate and invert in two passes over a single uint8 buffer
+        image = self._cv2.convertScaleAbs(
+            self.map_data, alpha=max_value / 100.0)
+        self._cv2.bitwise_not(image, dst=image)
+        unknown = self.unknown_mask
+        if unknown is not None:
+            image[unknown] = unknown_value
+        self._cv2.flip(image, 0, dst=image)
+
+        dst = tempfile.mkdtemp()
         if tar:
+            # encode and archive in memory, only the zip touches the disk
+            _, buf = self._cv2.imencode(".pgm", image)
             out = os.path.join(dst, "map.zip")
-            with zip_write.ZipFile(out, 'w') as zipObj:
-                zipObj.write(image_path, "map.pgm")
-                zipObj.write(yml_path, "map.yaml")
+            with zip_write.ZipFile(out, 'w',
+                                   compression=zip_write.ZIP_DEFLATED,
+                                   compresslevel=1) as zipObj:
+                zipObj.writestr("map.pgm", buf.tobytes())
+                zipObj.writestr("map.yaml", yaml.dump(
+                    map_file_config, Dumper=_Dumper))
             FileOps.upload(out, file_out, clean=True)
         else:
+            image_path = os.path.join(dst, "map.pgm")
+            yml_path = os.path.join(dst, "map.yml")
+            with open(yml_path, 'w') as file:
+                yaml.dump(map_file_config, file, Dumper=_Dumper)
+            self._cv2.imwrite(image_path, image)
             FileOps.upload(image_path, file_out, clean=True)
             FileOps.upload(yml_path, file_out, clean=True)
@@ -23,6 +23,8 @@ from robosdk.common.config import Config
 from robosdk.common.schema.pose import BasePose
 from robosdk.sensors.base import RosSensorBase
 from robosdk.utils.lazy_imports import LazyImport
+from robosdk.utils.util import quat_to_yaw
+from robosdk.utils.util import yaw_to_quat
 
 from .base import OdometryBase
 
@@ -36,6 +38,7 @@ class RosOdometryBase(OdometryBase):  # noqa
         self._base_link = getattr(self.config.data, "base_link", "base_link")
         self._map_frame = getattr(self.config.data, "map_frame", "map")
         self._transformer = LazyImport("tf.transformations")
+        self._rot_cache = None
 
     @property
     def pose(self):
@@ -48,17 +51,16 @@ class RosOdometryBase(OdometryBase):  # noqa
         raise NotImplementedError
 
     def _transfrom(self, value: str, sub_value: str):
-        pose = BasePose()
         ts = self.sys_time
         v = getattr(self.pose, value, None)
-        if not (v and hasattr(v, sub_value)):
-            return pose, ts
-        state = getattr(v, sub_value)
-        pose.x = getattr(state, "x", 0)
-        pose.y = getattr(state, "y", 0)
-        pose.z = getattr(state, "z", 0)
-        pose.w = getattr(state, "w", 0)
-        return pose, ts
+        state = getattr(v, sub_value, None) if v else None
+        if state is None:
+            return BasePose(), ts
+        # `construct` fills the pose in one call, skipping validation and
+        # the per-field __setattr__ of pydantic
+        return BasePose.construct(
+            x=state.x, y=state.y, z=state.z, w=getattr(state, "w", 0)
+        ), ts
 
     def get_angular_velocity(self) -> Tuple[BasePose, Any]:
         return self._transfrom("twist", "angular")
@@ -66,28 +68,32 @@ class RosOdometryBase(OdometryBase):  # noqa
     def get_linear_acceleration(self) -> Tuple[BasePose, Any]:
         return self._transfrom("twist", "linear")
 
+    def _rotation(self, orientation: BasePose) -> np.ndarray:
+        """3x3 rotation of the orientation, rebuilt only when it changes"""
+        quat = (orientation.x, orientation.y, orientation.z, orientation.w)
+        if self._rot_cache is None or self._rot_cache[0] != quat:
+            rotation = self._transformer.quaternion_matrix(quat)[:3, :3]
+            self._rot_cache = (quat, np.ascontiguousarray(rotation))
+        return self._rot_cache[1]
+
     def quat2mat(self, data: np.ndarray, base_position: np.ndarray = None):
         position, _ = self.get_position()
         orientation, _ = self.get_orientation()
-        rotation = self._transformer.quaternion_matrix((
-            orientation.x,
-            orientation.y,
-            orientation.z,
-            orientation.w,
-        ))
+        rotation = self._rotation(orientation)
+
         shape = data.shape
-        s = 4 - shape[1]
-        if s > 0:
-            data = np.hstack((data, np.zeros((shape[0], s))))
-        elif s < 0:
-            data = data[..., : 4]
-        points = rotation.dot(data.T).T
-        points[..., 0] += position.x
-        points[..., 1] += position.y
-        points[..., 2] += position.z
+        # row vectors, so p @ R.T rotates without transposing the points;
+        # missing axes are zero, so drop their rotation columns instead of
+        # padding the input, the homogeneous column is left as is
+        k = min(shape[1], 3)
+        points = np.empty((shape[0], 4), dtype=np.result_type(data, rotation))
+        np.matmul(data[:, :k], rotation[:, :k].T, out=points[:, :3])
+        points[:, 3] = data[:, 3] if shape[1] > 3 else 0.
+        points[:, :3] += (position.x, position.y, position.z)
 
         if base_position is not None:
-            _local = rotation.T.dot((points - base_position).T).T
+            _local = np.subtract(points, base_position)
+            _local[:, :3] = _local[:, :3] @ rotation
             points = _local[..., :shape[1]]
         return points
 
@@ -97,7 +103,7 @@ class RosOdometryBase(OdometryBase):  # noqa
         g.header.stamp = self.backend.now
         g.header.frame_id = self._map_frame
 
-        q = self._transformer.quaternion_from_euler(0, 0, goal.z)
+        q = yaw_to_quat(goal.z)
         g.pose.position.x = goal.x
         g.pose.position.y = goal.y
         g.pose.position.z = 0.0
@@ -109,23 +115,13 @@ class RosOdometryBase(OdometryBase):  # noqa
         return g
 
     def get_curr_state(self, **kwargs) -> BasePose:
-        curr_state = BasePose()
-
         position, _ = self.get_position()
         orientation, _ = self.get_orientation()
 
-        _, _, z = self._transformer.euler_from_quaternion((
-            orientation.x,
-            orientation.y,
-            orientation.z,
-            orientation.w
-        ))
-
-        curr_state.x = position.x
-        curr_state.y = position.y
-        curr_state.z = z
+        z = quat_to_yaw(orientation.x, orientation.y,
+                        orientation.z, orientation.w)
 
-        return curr_state
+        return BasePose.construct(x=position.x, y=position.y, z=z, w=0.0)
 
     def set_curr_state(self, state: BasePose, seq: int = 1):
 
@@ -165,33 +161,28 @@ class RosTFDriver(RosOdometryBase):  # noqa
         self._raw = None
 
     def get_position(self) -> Tuple[BasePose, Any]:
-        pose = BasePose()
         ts = self.sys_time
-
-        if self._position is None:
-            return pose, ts
-        pose.x = self._position.x
-        pose.y = self._position.y
-        pose.z = self._position.z
-        return pose, ts
+        position = self._position
+        if position is None:
+            return BasePose(), ts
+        return BasePose.construct(
+            x=position.x, y=position.y, z=position.z, w=0.0), ts
 
     def get_orientation(self) -> Tuple[BasePose, Any]:
-        orientation = BasePose()
         ts = self.sys_time
-
-        if not self._orientation:
-            return orientation, ts
-        orientation.x = self._orientation.x
-        orientation.y = self._orientation.y
-        orientation.z = self._orientation.z
-        orientation.w = self._orientation.w
-        return orientation, ts
+        orientation = self._orientation
+        if not orientation:
+            return BasePose(), ts
+        return BasePose.construct(x=orientation.x, y=orientation.y,
+                                  z=orientation.z, w=orientation.w), ts
 
     def _get_pose(self):
-        while 1:
-            buffer = self._tf.Buffer()
-            _ = self._tf.TransformListener(buffer)
-            trans = self.backend.msg_geometry_generator.TransformStamped()
+        # the listener fills the buffer in the background, build them once
+        buffer = self._tf.Buffer()
+        _ = self._tf.TransformListener(buffer)
+        rate = self.backend.client.Rate(
+            float(getattr(self.config.data, "rate", 0) or 50))
+        while self.has_connect:
             try:
                 trans = buffer.lookup_transform(
                     self._map_frame, self._base_link,
@@ -201,9 +192,11 @@ class RosTFDriver(RosOdometryBase):  # noqa
             except Exception as err:  # noqa
                 self.logger.error(f"lookup Transform fail: {err}")
                 self.backend.client.sleep(.1)
+                continue
             self._position = trans.transform.translation
             self._orientation = trans.transform.rotation
             self._raw = trans
+            rate.sleep()
 
     @property
     def pose(self):
@@ -214,3 +207,7 @@ class RosTFDriver(RosOdometryBase):  # noqa
             return
         self.has_connect = True
         threading.Thread(target=self._get_pose, daemon=True).start()
+
+    def close(self):
+        # stops the lookup loop of `_get_pose`
+        self.has_connect = False
@@ -29,7 +29,7 @@ class VoiceBase(SensorBase):  # noqa
         super(VoiceBase, self).__init__(name=name, config=config)
         self.sensor_kind = "voice"
         self.voice_info = {}
-        self.data_lock = threading.RLock()
+        self.data_lock = threading.Lock()
 
     def get_data(self) -> Tuple[np.ndarray, Any]:
         raise NotImplementedError
@@ -32,6 +32,8 @@ class RosVoiceDriver(RosSensorBase, VoiceBase):  # noqa
     def __init__(self, name, config: Config = None):
         super(RosVoiceDriver, self).__init__(name=name, config=config)
         self._audio_cls = LazyImport("audio_common_msgs.msg")
+        self._data_view = None
+        self._tx_msg = None
 
         if hasattr(self.config, "info"):
             info_s_p = getattr(self.config.info, "subscribe", None) or {}
@@ -54,17 +56,32 @@ class RosVoiceDriver(RosSensorBase, VoiceBase):  # noqa
             self.voice_info = {}
         return self.voice_info
 
+    def _callback(self, data):
+        super(RosVoiceDriver, self)._callback(data)
+        if data is not None and data is self._raw:
+            # interpret each frame once, readers share the view
+            self._data_view = np.frombuffer(data.data, dtype=np.int16)
+
     @property
     def data(self) -> np.ndarray:
-        return np.frombuffer(
-            self._raw.data, dtype=np.int16)
+        return self._data_view
+
+    @property
+    def raw_bytes(self) -> bytes:
+        """undecoded audio payload of the latest frame"""
+        return None if self._raw is None else self._raw.data
 
     def close(self):
         super(RosVoiceDriver, self).close()
 
     def say(self, data: np.ndarray):
-        data_buffer = data.tobytes()
-        voice = self._audio_cls.AudioData(data=data_buffer)
+        voice = self._tx_msg
+        if voice is None:
+            # publish serializes synchronously, so one message is reused
+            voice = self._tx_msg = self._audio_cls.AudioData()
+        # the serializer needs an immutable bytes payload, which already
+        # encoded chunks are passed through as without another copy
+        voice.data = data if isinstance(data, bytes) else data.tobytes()
         self.backend.publish(
             data=voice, data_class=self._audio_cls.AudioData,
             name=self.config.output.target
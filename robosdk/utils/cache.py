@@ -13,12 +13,55 @@
 # limitations under the License.
 
 import json
+import math
 import tempfile
 from contextlib import ContextDecorator
 from pathlib import Path
 from typing import Any
 from typing import AnyStr
 
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """whether a nan/inf float is nested in the json containers of obj"""
+    if isinstance(obj, float):  # np.float64 included
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    return False
+
+
+try:
+    import orjson
+
+    # numpy scalars are common sensor values, json takes np.float64 too
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps(obj: Any) -> bytes:
+        if _has_non_finite(obj):
+            # orjson writes nan/inf as null, let json keep them round-trip
+            return _json_dumps(obj)
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which json still encodes
+            return _json_dumps(obj)
+
+    def _loads(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN / Infinity written by the json fallback
+            return json.loads(data)
+except ImportError:
+    _dumps = _json_dumps
+    _loads = json.loads
+
 __all__ = ("FileCache",)
 
 
@@ -30,10 +73,13 @@ class FileCache(ContextDecorator):
     def __init__(self, delete: bool = True):
         self.data = {}
         self._delete = delete
+        self._fh = None
 
     def __enter__(self):
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            self._cache_path = f.name
+        # the handle stays open for the lifetime of the cache, so repeated
+        # saves only rewrite its contents instead of reopening the file
+        self._fh = tempfile.NamedTemporaryFile(delete=False)
+        self._cache_path = self._fh.name
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -43,16 +89,28 @@ class FileCache(ContextDecorator):
         return self._cache_path
 
     def close(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
         if self._delete:
             Path(self._cache_path).unlink(missing_ok=True)
 
     def load(self):
-        with open(self._cache_path, "r", encoding="utf-8") as fin:
-            return json.load(fin)
+        if self._fh is None:
+            with open(self._cache_path, "rb") as fin:
+                return _loads(fin.read())
+        self._fh.seek(0)
+        return _loads(self._fh.read())
 
     def save(self):
-        with open(self._cache_path, "w", encoding="utf-8") as fout:
-            json.dump(self.data, fout)
+        if self._fh is None:
+            with open(self._cache_path, "wb") as fout:
+                fout.write(_dumps(self.data))
+            return self
+        self._fh.seek(0)
+        self._fh.truncate()
+        self._fh.write(_dumps(self.data))
+        self._fh.flush()
         return self
 
     def update(self, key: AnyStr, value: Any = ""):
@@ -74,3 +132,47 @@ def test_file_cache():
         cache.save()
         data = cache.load()
     assert data == {"a": "", "b": 1, "c": {"a": 0}, "d": "test"}
+
+
+def test_file_cache_numpy_scalar():
+    import math
+
+    import numpy as np
+
+    with FileCache() as cache:
+        cache.update("f", np.float64(0.5))
+        cache.update("n", float("nan"))
+        cache.update("big", 1 << 70)
+        cache.save()
+        data = cache.load()
+    assert data["f"] == 0.5
+    assert math.isnan(data["n"])
+    assert data["big"] == 1 << 70
+
+
+def test_file_cache_save_after_close():
+    with FileCache(delete=False) as cache:
+        cache.update("a", 1)
+        cache.save()
+    try:
+        cache.update("b", 2)
+        cache.save()
+        assert cache.load() == {"a": 1, "b": 2}
+    finally:
+        Path(cache._cache_path).unlink()  # noqa
+
+
+def test_file_cache_none_value():
+    data = {"a": None, "b": "null", "c": [1.5, None]}
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        # None is valid json, it stays on the orjson path
+        assert _dumps(data) == orjson.dumps(data)
+    with FileCache() as cache:
+        for key, value in data.items():
+            cache.update(key, value)
+        cache.save()
+        assert cache.load() == data
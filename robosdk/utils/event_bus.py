@@ -16,8 +16,11 @@ import abc
 import asyncio
 import inspect
 from contextvars import ContextVar
+from functools import lru_cache
 from typing import Dict
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 
 from pyee.asyncio import AsyncIOEventEmitter
@@ -51,6 +54,13 @@ class EventBusBase(abc.ABC, AsyncIOEventEmitter):
         ...
 
 
+@lru_cache(maxsize=None)
+def _run_signature(event: Type[EventBusBase]):
+    """parameter count and `parameter` argument of `event.run`"""
+    func_parameters = inspect.signature(event.run).parameters
+    return len(func_parameters), func_parameters.get("parameter")
+
+
 class EventHandlerValidator:
     EVENT_PARAMETER_COUNT = 2
 
@@ -63,12 +73,10 @@ class EventHandlerValidator:
         if parameter and not isinstance(parameter, Dict):
             raise ComponentError()
 
-        signature = inspect.signature(event.run)
-        func_parameters = signature.parameters
-        if len(func_parameters) != self.EVENT_PARAMETER_COUNT:
+        param_count, base_parameter = _run_signature(event)
+        if param_count != self.EVENT_PARAMETER_COUNT:
             raise ComponentError()
 
-        base_parameter = func_parameters.get("parameter")
         if base_parameter.default is not None and not parameter:
             raise RequiredParameterException(
                 cls_name=base_parameter.__class__.__name__,
@@ -90,13 +98,16 @@ class EventHandler:
             self.events.clear()
 
     async def _run_at_once(self) -> None:
-        futures = []
         event: Type[EventBusBase]
-        for event, parameter in self.events.items():
-            task = asyncio.create_task(event().run(parameter=parameter))
-            futures.append(task)
-
-        await asyncio.gather(*futures)
+        if len(self.events) == 1:
+            # a lone event needs no task wrapping or gathering
+            event, parameter = next(iter(self.events.items()))
+            await event().run(parameter=parameter)
+            return
+        await asyncio.gather(*(
+            event().run(parameter=parameter)
+            for event, parameter in self.events.items()
+        ))
 
 
 @singleton
@@ -116,19 +127,30 @@ class EventManager:
         self._event[event_tag] = event
 
     def emit(self, event_name: str, **kwargs):
-        if kwargs.get("event_tag"):
-            _event_tag = kwargs.pop("event_tag")
-            if _event_tag in self._event:
-                try:
-                    self._event[_event_tag].emit(event_name, **kwargs)
-                except Exception as e:
-                    self.logger.error(
-                        f"emit event {event_name} - {_event_tag} error: {e}"
-                    )
+        # kwargs is already a private dict, popping from it costs no copy
+        _event_tag = kwargs.pop("event_tag", None)
+        self.emit_many(((event_name, kwargs),), event_tag=_event_tag)
+
+    def emit_many(self, events: Sequence[Tuple[str, Dict]],
+                  event_tag: str = None):
+        """
+        emit a batch of (event_name, kwargs) to one event tag, or to
+        all the registered events when no tag is given.
+        """
+        if event_tag:
+            if event_tag not in self._event:
+                return
+            targets = ((event_tag, self._event[event_tag]),)
         else:
-            for _event_tag, event in self._event.items():
+            targets = tuple(self._event.items())
+        for _event_tag, event in targets:
+            emit, listeners = event.emit, event.listeners
+            for event_name, kwargs in events:
+                # unhandled "error" events still go through pyee, which raises
+                if event_name != "error" and not listeners(event_name):
+                    continue
                 try:
-                    event.emit(event_name, **kwargs)
+                    emit(event_name, **kwargs)
                 except Exception as e:
                     self.logger.error(
                         f"emit event {event_name} - {_event_tag} error: {e}"
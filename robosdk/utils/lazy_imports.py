@@ -30,22 +30,19 @@ class LazyImport(types.ModuleType):
         :return: attribute value
         """
 
-        name = object.__getattribute__(self, '__name__')
-
-        try:
-            __import__(name)
-        except ModuleNotFoundError:
-            return
-
-        module = sys.modules[name]
-
-        class LoadedLazyImport(types.ModuleType):
-            __get_attribute__ = module.__getattribute__
-            __repr__ = module.__repr__
-
-        # object.__setattr__(self, "__class__", LoadedLazyImport)
-
-        return module.__getattribute__(item)
+        namespace = object.__getattribute__(self, '__dict__')
+        module = namespace.get('_lazy_module')
+        if module is None:
+            name = namespace['__name__']
+            try:
+                __import__(name)
+            except ModuleNotFoundError:
+                return
+
+            # keep the loaded module, later accesses skip the import
+            module = namespace['_lazy_module'] = sys.modules[name]
+
+        return getattr(module, item)
 
     def __repr__(self):
         return object.__getattribute__(self, '__name__')
@@ -12,11 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import queue
+from collections import deque
 from typing import Any
 
 from robosdk.common.constant import InternalConst
-from robosdk.common.exceptions import RoboError
 
 
 class BaseQueue:
@@ -30,28 +29,46 @@ class BaseQueue:
         :param queue_maxsize: maxsize of queue
         :param keep_when_full: if True, when queue is full, pop the oldest data
         """
-        self.mq = queue.Queue(maxsize=queue_maxsize)
+        # deque append/popleft are atomic, and a bounded deque evicts the
+        # oldest item itself, so no queue.Queue mutex is needed
+        self._maxsize = queue_maxsize if queue_maxsize > 0 else None
+        self.mq = deque(maxlen=self._maxsize)
         self._full = keep_when_full
 
     def __len__(self):
-        return len(self.mq.queue)
+        return len(self.mq)
 
     def empty(self):
-        return self.mq.empty()
+        return not self.mq
 
     def get(self):
         try:
-            data = self.mq.get_nowait()
-        except queue.Empty:
-            data = None
-        return data
+            return self.mq.popleft()
+        except IndexError:
+            return None
 
     def put(self, data: Any):
-        if self.mq.full():
-            if self._full:
-                _ = self.get()
+        if not self._full and len(self.mq) == self._maxsize:
             return
-        try:
-            self.mq.put_nowait(data)
-        except Exception as e:  # noqa
-            raise RoboError(f'mq add message fail: {e}')
+        self.mq.append(data)
+
+
+class LatestValue:
+    """
+    Latest-value exchange, the producer swaps in a new reference with a
+    single store and readers take the current one without waiting.
+    """
+
+    __slots__ = ("_front", )
+
+    def __init__(self, data: Any = None):
+        self._front = data
+
+    def put(self, data: Any):
+        self._front = data
+
+    def get(self) -> Any:
+        return self._front
+
+    def clear(self):
+        self._front = None
@@ -16,8 +16,16 @@
 import asyncio
 import json
 from typing import Dict
+from typing import List
 
 import aiohttp
+from aiohttp.hdrs import METH_DELETE
+from aiohttp.hdrs import METH_GET
+from aiohttp.hdrs import METH_HEAD
+from aiohttp.hdrs import METH_OPTIONS
+from aiohttp.hdrs import METH_PATCH
+from aiohttp.hdrs import METH_POST
+from aiohttp.hdrs import METH_PUT
 from aiohttp.typedefs import StrOrURL
 
 __all__ = ("AsyncRequest", )
@@ -28,16 +36,24 @@ class Response:
     def __init__(self, content, response):
         self.content = content
         self.response = response
+        # decoded body per encoding and parsed json, filled on first use
+        self._text = {}
+        self._json = None
 
     def raw(self):
         return self.response
 
     def text(self, encoding="utf-8"):
-        return self.content.decode(encoding)
+        text = self._text.get(encoding)
+        if text is None:
+            text = self._text[encoding] = self.content.decode(encoding)
+        return text
 
     @property
     def json(self):
-        return json.loads(self.text())
+        if self._json is None:
+            self._json = json.loads(self.text())
+        return self._json
 
     def __repr__(self):
         return f"<Response [status {self.response.status}]>"
@@ -57,26 +73,40 @@ class AsyncRequest:
     convenient way to make asynchronous requests.
     """
 
+    CHUNK_SIZE: int = 64 * 1024
+
     def __init__(self, token: str = "", proxies: str = "", **parameter):
-        header = parameter.get("headers", {})
         if token:
-            header[aiohttp.hdrs.AUTHORIZATION] = token
-        parameter["headers"] = header
+            parameter.setdefault(
+                "headers", {})[aiohttp.hdrs.AUTHORIZATION] = token
 
         # if os.getenv("http_proxy", "") or os.getenv("https_proxy", ""):
         #     parameter["trust_env"] = True
-        self._loop = asyncio.get_event_loop()
-        self._client = aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(verify_ssl=False),
-            **parameter)
+        # the session binds to the loop it is created in, so it is built
+        # lazily by the first request instead of here
+        self._session_kwargs = parameter
+        self._client = None
+        self._loop = None
         self._tasks = []
         self._result = []
-        self._proxies = proxies
+        self._proxy = proxies or None
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._client is None or self._client.closed:
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(verify_ssl=False),
+                **self._session_kwargs)
+        return self._client
+
+    def _run_sync(self, coro):
+        """run a coroutine on the loop owned by this instance, pass the
+        bare coroutine so no future is bound to another loop first"""
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
 
     def set_auth_token(self, token: str):
-        self._client.headers.update({
-            aiohttp.hdrs.AUTHORIZATION: token
-        })
+        self._set_header(aiohttp.hdrs.AUTHORIZATION, token)
 
     def auth_with_iam(self,
                       ak: str, sk: str, server: str,
@@ -118,163 +148,184 @@ class AsyncRequest:
                 }
             }
         }
+
         # get auth token from iam server
-        resp = self._loop.run_until_complete(
-            self._client.post(
-                url=server,
-                headers=headers,
-                data=json.dumps(data)
-            )
-        )
+        token = self._run_sync(self._async_iam_token(
+            server=server, headers=headers, data=json.dumps(data)))
         # update headers
-        self._client.headers.update({
-            "Content-Type": "application/json",
-            "X-Auth-Token": resp.headers.get("X-Subject-Token")
-        })
+        self._set_header("Content-Type", "application/json")
+        self._set_header("X-Auth-Token", token)
+
+    async def _async_iam_token(self, server: str, headers: Dict, data: str):
+        client = await self._ensure_session()
+        # the context releases the connection back to the pool
+        async with client.post(url=server, headers=headers,
+                               data=data, proxy=self._proxy) as resp:
+            return resp.headers.get("X-Subject-Token")
 
     def set_header(self, headers: Dict):
         """ update headers """
-        self._client.headers.update(headers)
+        self._session_kwargs.setdefault("headers", {}).update(headers)
+        if self._client is not None:
+            self._client.headers.update(headers)
+
+    def _set_header(self, key: str, value: str):
+        """ set a single header without building a temporary dict """
+        self._session_kwargs.setdefault("headers", {})[key] = value
+        if self._client is not None:
+            self._client.headers[key] = value
 
     def set_cookies(self, cookies: Dict):
         """ update cookies """
-        self._client._cookie_jar.update_cookies(cookies)
+        self._session_kwargs.setdefault("cookies", {}).update(cookies)
+        if self._client is not None:
+            self._client.cookie_jar.update_cookies(cookies)
 
     async def __aenter__(self):
+        await self._ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._client.close()
+        await self.async_close()
 
     async def _request(self, method: str, str_or_url: StrOrURL, **parameter):
         """ send request """
-        async with self._client.request(
+        client = await self._ensure_session()
+        async with client.request(
                 url=str_or_url, method=method,
-                proxy=self._get_proxy(), **parameter
+                proxy=self._proxy, **parameter
         ) as resp:
-            self._result.append(
-                Response(await resp.read(), resp)
-            )
+            return Response(await resp.read(), resp)
 
     def async_get(self, url: StrOrURL, *,
                   allow_redirects: bool = True, **kwargs):
         """Perform HTTP GET request."""
-        self.add(method=aiohttp.hdrs.METH_GET, url=url,
+        if allow_redirects and not kwargs:
+            # plain GETs (health checks mostly) skip repacking the kwargs,
+            # aiohttp already follows redirects by default
+            self._tasks.append(self._request(METH_GET, url))
+            return
+        self.add(method=METH_GET, url=url,
                  allow_redirects=allow_redirects, **kwargs)
 
     def async_options(
             self, url: StrOrURL, *, allow_redirects: bool = True, **kwargs
     ):
         """Perform HTTP OPTIONS request."""
-        self.add(method=aiohttp.hdrs.METH_OPTIONS, url=url,
+        self.add(method=METH_OPTIONS, url=url,
                  allow_redirects=allow_redirects, **kwargs)
 
     def async_head(self, url: StrOrURL, *,
                    allow_redirects: bool = True, **kwargs):
         """Perform HTTP HEAD request."""
-        self.add(method=aiohttp.hdrs.METH_HEAD, url=url,
+        self.add(method=METH_HEAD, url=url,
                  allow_redirects=allow_redirects, **kwargs)
 
     def async_post(self, url: StrOrURL, *, data=None, **kwargs):
         """Perform HTTP POST request."""
-        self.add(method=aiohttp.hdrs.METH_POST, url=url,
+        self.add(method=METH_POST, url=url,
                  data=data, **kwargs)
 
     def async_put(self, url: StrOrURL, *, data=None, **kwargs):
         """Perform HTTP PUT request."""
-        self.add(method=aiohttp.hdrs.METH_PUT, url=url,
+        self.add(method=METH_PUT, url=url,
                  data=data, **kwargs)
 
     def async_patch(self, url: StrOrURL, *, data=None, **kwargs):
         """Perform HTTP PATCH request."""
         self.add(
-            method=aiohttp.hdrs.METH_PATCH, url=url, data=data, **kwargs
+            method=METH_PATCH, url=url, data=data, **kwargs
         )
 
-    def _get_proxy(self):
-        return self._proxies or None
-
     async def async_download(self, url: StrOrURL, dst_file: str,
                              method: str = "GET", **parameter):
         import aiofiles
 
-        async with asyncio.Semaphore(1):
-            async with self._client.request(url=url, method=method,
-                                            proxy=self._get_proxy(),
-                                            **parameter) as resp:
-                content = await resp.read()
-
+        client = await self._ensure_session()
+        async with client.request(url=url, method=method,
+                                  proxy=self._proxy,
+                                  **parameter) as resp:
             if resp.status != 200:
                 raise aiohttp.ClientError(
                     f"Download failed: [{resp.status}]")
-
-            async with aiofiles.open(dst_file, "+wb") as f:
-                await f.write(content)
-            self._result.append(Response(dst_file, resp))
+            # stream to disk, only one chunk is resident at a time
+            async with aiofiles.open(dst_file, "wb") as f:
+                async for chunk in resp.content.iter_chunked(self.CHUNK_SIZE):
+                    await f.write(chunk)
+        return Response(dst_file, resp)
 
     def download(self, url: StrOrURL, dst_file: str,
                  method: str = "GET", **parameter):
-        self._result = []
-        self._loop.run_until_complete(
+        return self._run_sync(
             self.async_download(url=url, dst_file=dst_file,
                                 method=method, **parameter)
         )
-        return self._result[-1] if self._result else None
 
     def async_delete(self, url: StrOrURL, **kwargs):
         """Perform HTTP DELETE request."""
-        self.add(method=aiohttp.hdrs.METH_DELETE, url=url, **kwargs)
+        self.add(method=METH_DELETE, url=url, **kwargs)
 
     def delete(self, url: StrOrURL, **kwargs):
         """Perform HTTP DELETE request."""
-        self._result = []
-        self._loop.run_until_complete(
-            self._request(method=aiohttp.hdrs.METH_DELETE,
+        return self._run_sync(
+            self._request(method=METH_DELETE,
                           str_or_url=url, **kwargs)
         )
-        return self._result[-1] if self._result else None
 
     def add(self, url: str, method: str = "GET", **parameter):
+        # queued as coroutines, they are scheduled on whichever loop runs them
         self._tasks.append(
-            asyncio.ensure_future(
-                self._request(str_or_url=url, method=method, **parameter)
-            )
+            self._request(str_or_url=url, method=method, **parameter)
         )
 
+    def _pop_tasks(self):
+        tasks, self._tasks = self._tasks, []
+        return tasks
+
     def request(self, url: str, method: str = "GET", **parameter):
-        self._result = []
-        self._loop.run_until_complete(
+        return self._run_sync(
             self._request(str_or_url=url, method=method, **parameter)
         )
-        return self._result[-1] if self._result else None
 
     async def async_request(self, url: str, method: str = "GET", **parameter):
-        self._result = []
-        await self._request(str_or_url=url, method=method, **parameter)
-        return self._result[-1] if self._result else None
+        return await self._request(
+            str_or_url=url, method=method, **parameter)
+
+    @staticmethod
+    def _collect(results) -> List[Response]:
+        # gather keeps submission order, failed requests are dropped
+        return [res for res in results if isinstance(res, Response)]
 
     def run(self):
-        self._result = []
-        self._loop.run_until_complete(asyncio.wait(self._tasks))
-        return self._result
+        # gather has to be built inside the loop that awaits it
+        return self._run_sync(self.async_run())
 
     async def async_ping(self, url):
-        async with self._client.get(url, proxy=self._get_proxy()) as resp:
+        client = await self._ensure_session()
+        async with client.get(url, proxy=self._proxy) as resp:
             assert not str(resp.status).startswith(("4", "5"))
 
     def ping(self, url):
-        self._loop.run_until_complete(self.async_ping(url=url))
+        self._run_sync(self.async_ping(url=url))
 
     async def async_run(self):
-        self._result = []
-        await asyncio.wait(self._tasks)
+        tasks = self._pop_tasks()
+        self._result = self._collect(await asyncio.gather(
+            *tasks, return_exceptions=True
+        )) if tasks else []
         return self._result
 
     async def async_close(self):
-        await self._client.close()
+        if self._client is not None:
+            await self._client.close()
+        self._client = None
 
     def close(self):
-        self._loop.run_until_complete(self._client.close())
+        if self._client is not None:
+            self._run_sync(self.async_close())
+        if self._loop is not None and not self._loop.is_running():
+            self._loop.close()
+        self._loop = None
 
 
 def test_async_request():
@@ -284,3 +335,33 @@ def test_async_request():
     a.async_put("https://www.huawei.com")
     r = list(sorted([d.status for d in a.run()]))
     assert r == [200, 200, 405]
+
+
+def test_async_request_run_batch():
+    from aiohttp import web
+
+    async def handle(request):
+        return web.Response(text=request.method)
+
+    async def start_server():
+        app = web.Application()
+        app.router.add_route("*", "/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # noqa
+        return runner, f"http://127.0.0.1:{port}/"
+
+    a = AsyncRequest()
+    runner, url = a._run_sync(start_server())  # noqa
+    try:
+        a.async_get(url)
+        a.async_get("http://127.0.0.1:1/")  # refused, dropped from results
+        a.async_post(url)
+        # results follow submission order, not completion order
+        assert [d.text() for d in a.run()] == ["GET", "POST"]
+        assert a.run() == []
+    finally:
+        a._run_sync(runner.cleanup())  # noqa
+        a.close()
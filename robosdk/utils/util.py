@@ -14,17 +14,21 @@
 
 """This script contains some common tools."""
 import asyncio
+import math
 import os
 import platform
 import socket
+import threading
 import warnings
-from copy import deepcopy
+import weakref
+from functools import lru_cache
 from functools import wraps
 from inspect import getfullargspec
 from typing import Callable
+from typing import FrozenSet
+from typing import Tuple
 
 import numpy as np
-import yaml
 from robosdk.common.schema.pose import BasePose
 
 
@@ -47,26 +51,33 @@ def singleton(cls):
     :param cls: class
     :return: instance
     """
-    __instances__ = {}
+    instance = None
+    lock = threading.Lock()
 
     @wraps(cls)
     def get_instance(*args, **kw):
-        """Get class instance and save it into glob list."""
-        if cls not in __instances__:
-            __instances__[cls] = cls(*args, **kw)
-
-        return __instances__[cls]
+        """Get class instance, building it on the first call."""
+        nonlocal instance
+        if instance is None:
+            # only the first construction is serialized
+            with lock:
+                if instance is None:
+                    instance = cls(*args, **kw)
+        return instance
 
     return get_instance
 
 
+@lru_cache(maxsize=1)
 def get_machine_type() -> str:
     """get machine type"""
-    return str(platform.machine()).lower()
+    return platform.machine().lower()
 
 
+@lru_cache(maxsize=1)
 def get_host_ip():
-    """get local ip address"""
+    """get local ip address, resolved once per process;
+    call `get_host_ip.cache_clear()` after a network change"""
     name = socket.gethostname()
     try:
         return socket.gethostbyname(name)
@@ -74,33 +85,69 @@ def get_host_ip():
         return name
 
 
+@lru_cache(maxsize=64)
+def _suppress_msg(method: str, item: str) -> str:
+    return f"{method} | [{item}] unable working."
+
+
 class MethodSuppress:
     """
     Suppress the method of the class.
     """
 
-    __dict__ = {}
+    __slots__ = ("_method", "logger")
 
     def __init__(self, logger, method: str = ""):
         self._method = method
         self.logger = logger
 
     def __getattr__(self, item):
-        self.logger.error(f"{self._method} | [{item}] unable working.")
-        raise AttributeError
+        msg = _suppress_msg(self._method, item)
+        self.logger.error(msg)
+        raise AttributeError(msg)
+
+
+@lru_cache(maxsize=1)
+def _yaml_loader():
+    # yaml is only imported by the contexts that read a config map
+    try:
+        # libyaml bindings, config maps never need python object tags
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+        warnings.warn("libyaml is not available, "
+                      "falling back to the pure python yaml loader")
+    return Loader
+
+
+@lru_cache(maxsize=32)
+def _parse_config_map(path: str, mtime_ns: int, size: int):
+    import yaml
+
+    # keyed by the file stat, an edited config map misses the cache
+    with open(path, "rb", buffering=1 << 16) as stream:
+        return yaml.load(stream, Loader=_yaml_loader())
 
 
 class EnvBaseContext:
     """The Context provides the capability of obtaining the context"""
+    __slots__ = ("_raw", )
+
     parameters = os.environ
 
+    def __init__(self):
+        # one saved object per level, the same context can be re-entered
+        self._raw = []
+
     def __enter__(self):
-        self._raw = deepcopy(self.parameters)
+        self._raw.append(dict(type(self).parameters))
         self.load()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.parameters = self._raw
+        # load() rebinds the class attribute, restore it there too
+        type(self).parameters = self._raw.pop()
 
     @classmethod
     def load(cls, config_map: str = ""):
@@ -108,20 +155,27 @@ class EnvBaseContext:
             config_map = cls.get("CONFIG_MAP", "")
         if not os.path.isfile(config_map):
             return
+        import yaml
+
         cls.parameters = dict(cls.parameters)
-        with open(config_map, "r") as stream:
-            try:
-                cm = yaml.load(stream, Loader=yaml.FullLoader)
-            except yaml.YAMLError as e:
-                warnings.warn(f"Error detect while loading {config_map}, {e}")
-            else:
-                if isinstance(cm, dict):
-                    cls.parameters.update(cm)
-                elif isinstance(cm, (tuple, list)):
-                    for item in cm:
-                        if not isinstance(item, dict):
-                            continue
-                        cls.parameters.update(item)
+        st = os.stat(config_map)
+        try:
+            cm = _parse_config_map(config_map, st.st_mtime_ns, st.st_size)
+        except yaml.YAMLError as e:
+            warnings.warn(f"Error detect while loading {config_map}, {e}")
+        else:
+            if isinstance(cm, dict):
+                cls.parameters.update(cm)
+            elif isinstance(cm, (tuple, list)):
+                for item in cm:
+                    if not isinstance(item, dict):
+                        continue
+                    cls.parameters.update(item)
+
+    @classmethod
+    def invalidate(cls):
+        """drop the parsed config maps, forces a re-read on next load"""
+        _parse_config_map.cache_clear()
 
     @classmethod
     def update(cls, key, value=""):
@@ -131,8 +185,12 @@ class EnvBaseContext:
     def get(cls, param: str, default: str = None) -> str:
         """get the value of the key `param` in `PARAMETERS`,
         if not exist, the default value is returned"""
-        value = cls.parameters.get(
-            param) or cls.parameters.get(str(param).upper())
+        value = cls.parameters.get(param)
+        if not value:
+            # only fall back to the upper-case name on a miss
+            upper = str(param).upper()
+            if upper != param:
+                value = cls.parameters.get(upper)
         return value or default
 
     @classmethod
@@ -144,36 +202,124 @@ def parse_kwargs(func: Callable, **kwargs):
     """
     Parse kwargs to func.
     """
-    use_kwargs = getfullargspec(func)
-    if use_kwargs.varkw == "kwargs":
+    # bound methods share the spec of their function, cache on that so
+    # the cache does not keep instances alive
+    target = getattr(func, "__func__", func)
+    try:
+        spec = _ARGSPEC.get(target)
+        if spec is None:
+            spec = _ARGSPEC[target] = _kwargs_spec(target)
+    except TypeError:  # unhashable or not weak referenceable
+        spec = _kwargs_spec(target)
+    accept_all, args = spec
+    if accept_all:
         return dict(kwargs)
-    return {k: v for k, v in kwargs.items() if k in use_kwargs.args}
+    return {k: v for k, v in kwargs.items() if k in args}
 
 
-def q_to_euler(q: BasePose) -> BasePose:
+# weak keys, callbacks built at runtime are not pinned by the cache
+_ARGSPEC = weakref.WeakKeyDictionary()
+
+
+def _kwargs_spec(func: Callable) -> Tuple[bool, FrozenSet[str]]:
+    use_kwargs = getfullargspec(func)
+    return use_kwargs.varkw == "kwargs", frozenset(use_kwargs.args)
+
+
+def _q_to_euler_scalar(w: float, x: float, y: float,
+                       z: float) -> Tuple[float, float, float]:
     """
-    Convert quaternion to euler.
+    Convert quaternion (w, x, y, z) to euler (roll, pitch, yaw)
+    with scalar math, avoiding numpy dispatch for a single pose.
     """
     my_epsilon = 1e-10
-    euler = BasePose()
-    sqx, sqy, sqz, sqw = np.square([q.x, q.y, q.z, q.w])
-
-    euler.y = np.arcsin(2.0 * (q.w * q.y - q.x * q.z))
-    if np.pi / 2 - np.abs(euler.y) > my_epsilon:
-        euler.z = np.arctan2(
-            2.0 * (q.x * q.y + q.w * q.z),
-            sqx - sqy - sqz + sqw)
-        euler.x = np.arctan2(
-            2.0 * (q.w * q.x + q.y * q.z),
-            sqw - sqx - sqy + sqz)
+    sqx, sqy, sqz, sqw = x * x, y * y, z * z, w * w
+
+    # clamp rounding noise outside of the asin domain
+    pitch = math.asin(max(-1.0, min(1.0, 2.0 * (w * y - x * z))))
+    if math.pi / 2 - abs(pitch) > my_epsilon:
+        yaw = math.atan2(2.0 * (x * y + w * z), sqx - sqy - sqz + sqw)
+        roll = math.atan2(2.0 * (w * x + y * z), sqw - sqx - sqy + sqz)
     else:
-        euler.z = np.arctan2(
-            2 * q.y * q.z - 2 * q.x * q.w,
-            2 * q.x * q.z + 2 * q.y * q.w)
-        euler.x = 0.0
+        yaw = math.atan2(2 * y * z - 2 * x * w, 2 * x * z + 2 * y * w)
+        roll = 0.0
         # If facing down, reverse yaw
-        if euler.y < 0:
-            euler.z = np.pi - euler.z
+        if pitch < 0:
+            yaw = math.pi - yaw
+    return roll, pitch, yaw
+
+
+def q_to_euler(q: BasePose) -> BasePose:
+    """
+    Convert quaternion to euler.
+    """
+    roll, pitch, yaw = _q_to_euler_scalar(q.w, q.x, q.y, q.z)
+    return BasePose(x=roll, y=pitch, z=yaw)
+
+
+def yaw_to_quat(yaw: float) -> Tuple[float, float, float, float]:
+    """
+    Convert a rotation around z to quaternion (x, y, z, w).
+    """
+    half = yaw * 0.5
+    return 0.0, 0.0, math.sin(half), math.cos(half)
+
+
+def quat_to_yaw(x: float, y: float, z: float, w: float) -> float:
+    """
+    Extract the rotation around z from quaternion (x, y, z, w).
+    """
+    # scale invariant form, so non-unit quaternions need no normalizing
+    return math.atan2(2.0 * (w * z + x * y), w * w + x * x - y * y - z * z)
+
+
+def q_to_euler_batch(qs: np.ndarray) -> np.ndarray:
+    """
+    Convert quaternions of shape (N, 4), ordered as (x, y, z, w),
+    to euler angles of shape (N, 3), ordered as (roll, pitch, yaw).
+    """
+    qs = np.asarray(qs, dtype=np.float64)
+    x, y, z, w = qs[:, 0], qs[:, 1], qs[:, 2], qs[:, 3]
+    euler = np.empty((len(qs), 3), dtype=np.float64)
+    roll, pitch, yaw = euler[:, 0], euler[:, 1], euler[:, 2]
+
+    # pitch = asin(2 * (w * y - x * z))
+    np.multiply(w, y, out=pitch)
+    pitch -= x * z
+    pitch *= 2.0
+    np.clip(pitch, -1.0, 1.0, out=pitch)
+    np.arcsin(pitch, out=pitch)
+
+    # yaw = atan2(2 * (x * y + w * z), 1 - 2 * (y * y + z * z))
+    np.multiply(x, y, out=yaw)
+    yaw += w * z
+    yaw *= 2.0
+    den = y * y
+    den += z * z
+    den *= -2.0
+    den += 1.0
+    np.arctan2(yaw, den, out=yaw)
+
+    # roll = atan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y))
+    np.multiply(w, x, out=roll)
+    roll += y * z
+    roll *= 2.0
+    np.multiply(x, x, out=den)
+    den += y * y
+    den *= -2.0
+    den += 1.0
+    np.arctan2(roll, den, out=roll)
+
+    gimbal = np.pi / 2 - np.abs(pitch) <= 1e-10
+    if gimbal.any():
+        gx, gy, gz, gw = x[gimbal], y[gimbal], z[gimbal], w[gimbal]
+        g_yaw = np.arctan2(2 * gy * gz - 2 * gx * gw,
+                           2 * gx * gz + 2 * gy * gw)
+        # If facing down, reverse yaw
+        down = pitch[gimbal] < 0
+        g_yaw[down] = np.pi - g_yaw[down]
+        yaw[gimbal] = g_yaw
+        roll[gimbal] = 0.0
     return euler
 
 
@@ -181,12 +327,36 @@ def euler_to_q(euler: BasePose) -> BasePose:
     """
     Convert euler to quaternion.
     """
-    q = BasePose()
-    cx, cy, cw = np.cos(np.array([euler.x, euler.y, euler.z]) / 2.0)
-    sx, sy, sw = np.sin(np.array([euler.x, euler.y, euler.z]) / 2.0)
-    q.x = cw * cy * sx - sw * sy * cx
-    q.y = cw * sy * cx + sw * cy * sx
-    q.z = sw * cy * cx - cw * sy * sx
-    q.w = cw * cy * cx + sw * sy * sx
-
-    return q
+    hx, hy, hw = euler.x * 0.5, euler.y * 0.5, euler.z * 0.5
+    cx, cy, cw = math.cos(hx), math.cos(hy), math.cos(hw)
+    sx, sy, sw = math.sin(hx), math.sin(hy), math.sin(hw)
+    return BasePose(
+        x=cw * cy * sx - sw * sy * cx,
+        y=cw * sy * cx + sw * cy * sx,
+        z=sw * cy * cx - cw * sy * sx,
+        w=cw * cy * cx + sw * sy * sx,
+    )
+
+
+def euler_to_q_batch(eulers: np.ndarray) -> np.ndarray:
+    """
+    Convert euler angles of shape (N, 3), ordered as (roll, pitch, yaw),
+    to quaternions of shape (N, 4), ordered as (x, y, z, w).
+    """
+    half = np.multiply(eulers, 0.5, dtype=np.float64)
+    c, s = np.cos(half), np.sin(half)
+    cx, cy, cw = c[:, 0], c[:, 1], c[:, 2]
+    sx, sy, sw = s[:, 0], s[:, 1], s[:, 2]
+    cwcy, swsy = cw * cy, sw * sy
+    cwsy, swcy = cw * sy, sw * cy
+
+    qs = np.empty((len(half), 4), dtype=np.float64)
+    np.multiply(cwcy, sx, out=qs[:, 0])
+    qs[:, 0] -= swsy * cx
+    np.multiply(cwsy, cx, out=qs[:, 1])
+    qs[:, 1] += swcy * sx
+    np.multiply(swcy, cx, out=qs[:, 2])
+    qs[:, 2] -= cwsy * sx
+    np.multiply(cwcy, cx, out=qs[:, 3])
+    qs[:, 3] += swsy * sx
+    return qs
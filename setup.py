@@ -14,6 +14,7 @@
 
 import os
 import sys
+from functools import lru_cache
 
 from setuptools import find_packages
 from setuptools import setup
@@ -25,7 +26,8 @@ package_name: str = "robosdk"
 
 class InstallPrepare:
     """
-    Parsing dependencies
+    Parsing dependencies, each file is read once
+    (functools.cached_property needs python 3.8)
     """
 
     package_path = os.path.dirname(__file__)
@@ -41,6 +43,7 @@ class InstallPrepare:
                                               "requirements.dev.txt")
 
     @property
+    @lru_cache(maxsize=None)
     def long_desc(self):
         if not os.path.isfile(self._long_desc):
             return ""
@@ -49,6 +52,7 @@ class InstallPrepare:
         return long_desc
 
     @property
+    @lru_cache(maxsize=None)
     def version(self):
         default_version = "dev"  # non-official version
         if not os.path.isfile(self._version):
@@ -58,6 +62,7 @@ class InstallPrepare:
         return __version__ or default_version
 
     @property
+    @lru_cache(maxsize=None)
     def owners(self):
         default_owner = "kubeEdge"
         if not os.path.isfile(self._owner):
@@ -74,6 +79,7 @@ class InstallPrepare:
         return ",".join(approver) or default_owner
 
     @property
+    @lru_cache(maxsize=None)
     def basic_dependencies(self):
         return self._read_requirements(self._requirements)
 
@@ -88,34 +94,37 @@ class InstallPrepare:
         paths = []
         data_prefix = os.path.join("share", package_name)
         for (root, sub_dir, filename) in os.walk(data_files):
-            if not len(filename):
-                continue
-            install_dir = os.path.join(data_prefix, root)
             entry_dir = [os.path.join(root, _f) for _f in
                          filename if _f.endswith(subfix)]
-
-            paths.append((install_dir, entry_dir))
+            # directories without matching files install nothing
+            if entry_dir:
+                paths.append((os.path.join(data_prefix, root), entry_dir))
         return paths
 
     @staticmethod
     def _read_requirements(file_path, section="all"):
         if not os.path.isfile(file_path):
             return []
+        # single pass, a "# <section>" comment opens a section and
+        # the next comment closes it
+        requires = []
+        section_start = section == "all"
+        marker = f"# {section}"
         with open(file_path, "r", encoding="utf-8") as f:
-            install_requires = [p.strip() for p in f.readlines() if p.strip()]
-        if section == "all":
-            return list(filter(lambda x: not x.startswith("#"),
-                               install_requires))
-        section_start = False
-        section_requires = []
-        for p in install_requires:
-            if section_start:
+            for line in f:
+                p = line.strip()
+                if not p:
+                    continue
                 if p.startswith("#"):
-                    return section_requires
-                section_requires.append(p)
-            elif p.startswith(f"# {section}"):
-                section_start = True
-        return section_requires
+                    if section == "all":
+                        continue
+                    if section_start:
+                        return requires
+                    section_start = p.startswith(marker)
+                    continue
+                if section_start:
+                    requires.append(p)
+        return requires
 
 
 _info = InstallPrepare()